@@ -1,9 +1,35 @@
 """Data models for user sessions and conversation analysis."""
 
-from .session_text import SessionText
-from .session import Session
-from .user import User
-from .loader import DataLoader
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = ["SessionText", "Session", "User", "DataLoader"]
+if TYPE_CHECKING:
+    from .session_text import MessageView, SessionText
+    from .session import Session
+    from .user import User
+    from .loader import DataLoader
 
+__all__ = ["SessionText", "MessageView", "Session", "User", "DataLoader"]
+
+# Submodule defining each export. Submodules are imported on first access,
+# so importing one model does not load the others.
+_EXPORT_MODULES = {
+    "SessionText": ".session_text",
+    "MessageView": ".session_text",
+    "Session": ".session",
+    "User": ".user",
+    "DataLoader": ".loader",
+}
+
+
+def __getattr__(name: str):
+    if name not in _EXPORT_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORT_MODULES[name], __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
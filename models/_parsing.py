@@ -0,0 +1,106 @@
+"""Polars expressions and helpers shared by the model CSV loaders."""
+
+from collections.abc import Callable, Collection
+from typing import TypeVar
+
+import polars as pl
+
+T = TypeVar("T")
+
+# Version of the CSV parsing rules. It is part of the Parquet cache file
+# names, so bump it whenever any scan_csv result changes for the same CSV
+PARSER_VERSION = 3
+
+# Timestamp layouts accepted in CSV files, tried in order
+DATETIME_FORMATS = (
+    "%Y-%m-%d %H:%M:%S%.f",
+    "%Y-%m-%dT%H:%M:%S%.f",
+    "%Y-%m-%d %H:%M",
+    "%Y-%m-%dT%H:%M",
+    "%Y-%m-%d",
+    "%Y%m%dT%H%M%S",
+    "%Y%m%d",
+)
+
+# Layouts of timestamps carrying a UTC offset (Z, +HH, +HHMM or +HH:MM);
+# these are converted to naive UTC
+DATETIME_OFFSET_FORMATS = (
+    "%Y-%m-%d %H:%M:%S%.f%#z",
+    "%Y-%m-%dT%H:%M:%S%.f%#z",
+    "%Y-%m-%d %H:%M%#z",
+    "%Y-%m-%dT%H:%M%#z",
+)
+
+
+def column_expr(name: str, columns: Collection[str]) -> pl.Expr:
+    """Select a CSV column, or a null String column if the CSV lacks it.
+    
+    Args:
+        name: Column name
+        columns: Names of the columns present in the CSV
+    
+    Returns:
+        Expression for the column
+    """
+    if name not in columns:
+        return pl.lit(None, dtype=pl.String).alias(name)
+    return pl.col(name)
+
+
+def uuid_expr(name: str, columns: Collection[str]) -> pl.Expr:
+    """Parse a UUID string column into the 16 raw bytes of each UUID.
+    
+    Hyphens, braces and urn:/uuid: prefixes are accepted; anything that is
+    not 32 hex digits once they are removed becomes null.
+    
+    Args:
+        name: Column name
+        columns: Names of the columns present in the CSV
+    
+    Returns:
+        Binary expression named name
+    """
+    value = column_expr(name, columns).str.to_lowercase().str.replace_all(r"urn:|uuid:|[{}-]", "")
+    return pl.when(value.str.contains(r"^[0-9a-f]{32}$")).then(value.str.decode("hex", strict=False)).alias(name)
+
+
+def datetime_expr(name: str, columns: Collection[str]) -> pl.Expr:
+    """Parse a timestamp string column, with null for unparseable values.
+    
+    Explicit formats parse far faster than letting Polars infer one.
+    Timestamps with a UTC offset are converted to UTC; all results are
+    naive.
+    
+    Args:
+        name: Column name
+        columns: Names of the columns present in the CSV
+    
+    Returns:
+        Datetime("us") expression named name
+    """
+    value = column_expr(name, columns)
+    return pl.coalesce([
+        *(value.str.to_datetime(fmt, strict=False, time_unit="us") for fmt in DATETIME_FORMATS),
+        *(
+            value.str.to_datetime(fmt, strict=False, time_unit="us")
+            .dt.convert_time_zone("UTC")
+            .dt.replace_time_zone(None)
+            for fmt in DATETIME_OFFSET_FORMATS
+        ),
+    ]).alias(name)
+
+
+def frame_to_models(cls: Callable[..., T], df: pl.DataFrame) -> list[T]:
+    """Build one model instance per row of a collected scan_csv DataFrame.
+    
+    The columns must be in the model's field order: each row is passed
+    positionally, so no keyword arguments are matched per instance.
+    
+    Args:
+        cls: Model class
+        df: DataFrame whose columns follow the model's fields
+    
+    Returns:
+        List of instances, in row order
+    """
+    return list(map(cls, *(series.to_list() for series in df.get_columns())))
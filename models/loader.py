@@ -1,14 +1,23 @@
 """DataLoader for loading and linking all models from CSV files."""
 
-from collections import defaultdict
+import re
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import cached_property
 from pathlib import Path
 from uuid import UUID
 
+import polars as pl
+
 from config import REGISTRATION_DAYS
-from .session_text import SessionText
-from .session import Session
-from .user import User
+from ._parsing import PARSER_VERSION
+from .session_text import SESSION_TEXT_SCHEMA, MessageView, SessionText
+from .session import SESSION_SCHEMA, Session
+from .user import USER_SCHEMA, User
+
+# Shared value for unlinked relationships
+_EMPTY: tuple = ()
 
 
 class DataLoader:
@@ -17,7 +26,17 @@ class DataLoader:
     This class handles loading users, sessions, and session texts from CSV files
     and establishes the relationships between them:
     - User.sessions: populated with Session objects
-    - Session.messages: populated with SessionText objects
+    - Session.messages: a MessageView over the session's SessionText rows,
+      sliced from a shared frame on access
+    
+    Session texts are by far the largest table, so they are kept in a single
+    columnar DataFrame (session_texts_df) and only materialized as
+    SessionText objects when accessed.
+    
+    Parsed CSVs are cached as Parquet files in a .cache directory inside
+    data_dir. A cache file is reused until its CSV is modified or the
+    parsing rules change (PARSER_VERSION), so repeated runs skip CSV
+    parsing entirely.
     
     Example:
         loader = DataLoader("raw_data/")
@@ -27,25 +46,30 @@ class DataLoader:
         for user in loader.users:
             print(f"User: {user.nick_name}")
             for session in user.sessions:
-                print(f"  Session: {session.uuid}")
+                print(f"  Session: {session.uuid_str}")
                 for msg in session.messages:
                     print(f"    {msg.speaker}: {msg.text[:50]}...")
     """
     
-    def __init__(self, data_dir: str | Path):
+    def __init__(self, data_dir: str | Path, use_cache: bool = True):
         """Initialize the DataLoader.
         
         Args:
             data_dir: Path to the directory containing the CSV files
+            use_cache: Whether to read and write the Parquet cache
         """
         self.data_dir = Path(data_dir)
+        self.use_cache = use_cache
         self.users: list[User] = []
+        self.users_df = pl.DataFrame(schema=USER_SCHEMA)
         self.sessions: list[Session] = []
-        self.session_texts: list[SessionText] = []
+        self.sessions_df = pl.DataFrame(schema=SESSION_SCHEMA)
+        self.session_texts_df = pl.DataFrame(schema=SESSION_TEXT_SCHEMA)
+        self.session_texts: Sequence[SessionText] = MessageView(self.session_texts_df)
         
-        # Lookup dictionaries for fast access
-        self._users_by_uuid: dict[UUID, User] = {}
-        self._sessions_by_uuid: dict[UUID, Session] = {}
+        # Lookup dictionaries for fast access, keyed by raw UUID bytes
+        self._users_by_uuid: dict[bytes, User] = {}
+        self._sessions_by_uuid: dict[bytes, Session] = {}
     
     def load_all(
         self,
@@ -62,9 +86,16 @@ class DataLoader:
             session_text_file: Filename for session text data
             link_relationships: Whether to populate relationship fields
         """
-        self.load_users(user_file)
-        self.load_sessions(session_file)
-        self.load_session_texts(session_text_file)
+        # Polars releases the GIL while parsing, so the session texts (the
+        # largest file) are read on a worker thread while users and then
+        # sessions, which are filtered by the loaded users, are read and
+        # turned into objects here. Loader state is only assigned on this
+        # thread.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            session_texts_future = executor.submit(self._read_session_texts, session_text_file)
+            self._set_users(self._read_users(user_file))
+            self._set_sessions(self._read_sessions(session_file, users_only=True))
+            self._set_session_texts(session_texts_future.result())
         
         if link_relationships:
             self.link_all()
@@ -78,51 +109,162 @@ class DataLoader:
         Returns:
             List of loaded User objects registered in the past REGISTRATION_DAYS days
         """
-        file_path = self.data_dir / filename
-        all_users = User.load_from_csv(file_path)
-        
-        # Filter users by registration time
-        cutoff_date = datetime.now() - timedelta(days=REGISTRATION_DAYS)
-        self.users = [
-            user for user in all_users
-            if user.registration_time and user.registration_time >= cutoff_date
-        ]
-        
-        self._users_by_uuid = {user.uuid: user for user in self.users}
+        self._set_users(self._read_users(filename))
         return self.users
     
-    def load_sessions(self, filename: str = "session.csv") -> list[Session]:
+    def load_sessions(self, filename: str = "session.csv", users_only: bool = False) -> list[Session]:
         """Load sessions from CSV file.
         
         Args:
             filename: Name of the session CSV file
+            users_only: Whether to keep only sessions started by the users
+                loaded by load_users (other sessions are dropped while the CSV
+                is being decoded)
             
         Returns:
-            List of loaded Session objects
+            List of loaded Session objects, sorted by begin_at
         """
-        file_path = self.data_dir / filename
-        self.sessions = Session.load_from_csv(file_path)
-        self._sessions_by_uuid = {session.uuid: session for session in self.sessions}
+        self._set_sessions(self._read_sessions(filename, users_only))
         return self.sessions
     
-    def load_session_texts(self, filename: str = "session_text.csv") -> list[SessionText]:
+    def load_session_texts(self, filename: str = "session_text.csv") -> pl.DataFrame:
         """Load session texts from CSV file.
         
         Args:
             filename: Name of the session text CSV file
             
         Returns:
-            List of loaded SessionText objects
+            DataFrame of loaded session texts sorted by (session_uuid,
+            start_at) (also exposed as a sequence of SessionText objects via
+            self.session_texts)
         """
+        self._set_session_texts(self._read_session_texts(filename))
+        return self.session_texts_df
+    
+    def _read_users(self, filename: str) -> pl.DataFrame:
+        """Read the users registered in the past REGISTRATION_DAYS days."""
+        file_path = self.data_dir / filename
+        
+        # Filter users by registration time while the CSV is being decoded
+        cutoff_date = datetime.now() - timedelta(days=REGISTRATION_DAYS)
+        return (
+            self._scan_with_cache(file_path, User.scan_csv, USER_SCHEMA)
+            .filter(pl.col("registration_time") >= cutoff_date)
+            .collect(engine="streaming")
+        )
+    
+    def _read_sessions(self, filename: str, users_only: bool) -> pl.DataFrame:
+        """Read sessions sorted by begin_at, optionally only those started by loaded users."""
         file_path = self.data_dir / filename
-        self.session_texts = SessionText.load_from_csv(file_path)
-        return self.session_texts
+        sessions_lf = self._scan_with_cache(file_path, Session.scan_csv, SESSION_SCHEMA)
+        if users_only:
+            sessions_lf = sessions_lf.filter(
+                pl.col("from_user_uuid").is_in(self.users_df["uuid"].to_list())
+            )
+        # Sorted once here so every user's sessions are grouped in order
+        return sessions_lf.sort("begin_at", maintain_order=True).collect(engine="streaming")
+    
+    def _read_session_texts(self, filename: str) -> pl.DataFrame:
+        """Read session texts sorted by (session_uuid, start_at)."""
+        file_path = self.data_dir / filename
+        # Polars already splits the file into chunks and parses them on all
+        # cores, so no manual sharding is needed here. Sorting once here
+        # makes each session's messages a contiguous, ordered run of rows.
+        return (
+            self._scan_with_cache(file_path, SessionText.scan_csv, SESSION_TEXT_SCHEMA)
+            .sort(["session_uuid", "start_at"], maintain_order=True)
+            .collect(engine="streaming")
+        )
+    
+    def _set_users(self, users_df: pl.DataFrame) -> None:
+        """Store users read by _read_users and index them by UUID."""
+        self.users_df = users_df
+        self.users = User.from_frame(users_df)
+        self._users_by_uuid = {user.uuid: user for user in self.users}
+        self._invalidate_stats()
+    
+    def _set_sessions(self, sessions_df: pl.DataFrame) -> None:
+        """Store sessions read by _read_sessions and index them by UUID."""
+        self.sessions_df = sessions_df
+        # Row i of sessions_df corresponds to self.sessions[i]
+        self.sessions = Session.from_frame(sessions_df)
+        self._sessions_by_uuid = {session.uuid: session for session in self.sessions}
+        self._invalidate_stats()
+    
+    def _set_session_texts(self, session_texts_df: pl.DataFrame) -> None:
+        """Store session texts read by _read_session_texts."""
+        self.session_texts_df = session_texts_df
+        self.session_texts = MessageView(session_texts_df)
+        self._invalidate_stats()
+    
+    def _invalidate_stats(self) -> None:
+        """Drop the cached stats so they are recomputed on next access."""
+        self.__dict__.pop("stats", None)
+    
+    def _scan_with_cache(
+        self,
+        file_path: Path,
+        scan_csv: Callable[[Path], pl.LazyFrame],
+        schema: pl.Schema,
+    ) -> pl.LazyFrame:
+        """Scan a CSV file through its Parquet cache.
+        
+        The cache is rebuilt when it is missing, older than the CSV,
+        unreadable, or was written with a different schema. Its file name includes
+        PARSER_VERSION, so caches written by other parser versions are never
+        read (and are removed once the new cache is written). If the cache
+        cannot be written, the CSV is scanned directly.
+        
+        Args:
+            file_path: Path to the CSV file
+            scan_csv: Model scan_csv method used to parse the CSV
+            schema: Expected schema of the parsed data
+            
+        Returns:
+            LazyFrame over the parsed data
+        """
+        if not self.use_cache:
+            return scan_csv(file_path)
+        
+        cache_dir = self.data_dir / ".cache"
+        cache_path = cache_dir / f"{file_path.stem}.v{PARSER_VERSION}.parquet"
+        try:
+            is_fresh = (
+                cache_path.exists()
+                and cache_path.stat().st_mtime >= file_path.stat().st_mtime
+                and pl.read_parquet_schema(cache_path) == schema
+            )
+        except (OSError, pl.exceptions.PolarsError):
+            # A truncated or foreign file is just a stale cache
+            is_fresh = False
+        if not is_fresh:
+            # Write to a temporary file first so a failed write never leaves
+            # a truncated cache behind
+            tmp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+            try:
+                try:
+                    cache_dir.mkdir(exist_ok=True)
+                    scan_csv(file_path).sink_parquet(tmp_path, compression="zstd")
+                    tmp_path.replace(cache_path)
+                finally:
+                    tmp_path.unlink(missing_ok=True)
+                
+                # Drop caches of this CSV written by other parser versions,
+                # but not those of other CSVs that share its name prefix
+                own_name = re.compile(rf"{re.escape(file_path.stem)}(\.v\d+)?\.parquet")
+                for stale_path in cache_dir.iterdir():
+                    if stale_path != cache_path and own_name.fullmatch(stale_path.name):
+                        stale_path.unlink(missing_ok=True)
+            except OSError:
+                return scan_csv(file_path)
+        
+        return pl.scan_parquet(cache_path)
     
     def link_all(self) -> None:
         """Link all relationships between models.
         
         This populates:
-        - Session.messages with SessionText objects
+        - Session.messages with a view of SessionText rows
         - User.sessions with Session objects
         """
         self.link_session_texts_to_sessions()
@@ -131,64 +273,122 @@ class DataLoader:
     def link_session_texts_to_sessions(self) -> None:
         """Link SessionText objects to their parent Session.
         
-        Populates Session.messages for each session.
+        Records, for each session, where its rows are in session_texts_df,
+        which is loaded sorted by (session_uuid, start_at). Session.messages
+        slices that frame on access.
         """
-        # Group session texts by session_uuid
-        texts_by_session: dict[UUID, list[SessionText]] = defaultdict(list)
-        for text in self.session_texts:
-            texts_by_session[text.session_uuid].append(text)
+        texts_df = self.session_texts_df
+        
+        # Find the runs (session_uuid, first row, row count) in native code,
+        # so the Python loop below is per session rather than per message
+        runs = (
+            texts_df.select(pl.col("session_uuid").rle())
+            .unnest("session_uuid")
+            .select("value", (pl.col("len").cum_sum() - pl.col("len")).alias("start"), "len")
+        )
+        text_ranges: dict[bytes, tuple[int, int]] = {
+            session_uuid: (start, length)
+            for session_uuid, start, length in runs.iter_rows()
+        }
         
-        # Sort messages by start_at and assign to sessions
+        # Assign to sessions
+        no_messages = (0, 0)
         for session in self.sessions:
-            messages = texts_by_session.get(session.uuid, [])
-            # Sort by start_at timestamp
-            messages.sort(key=lambda x: x.start_at or x.id)
-            session.messages = messages
+            session._link_messages(texts_df, text_ranges.get(session.uuid, no_messages))
+        self._invalidate_stats()
     
     def link_sessions_to_users(self) -> None:
         """Link Session objects to their parent User.
         
         Populates User.sessions for each user.
         """
-        # Group sessions by from_user_uuid
-        sessions_by_user: dict[UUID, list[Session]] = defaultdict(list)
-        for session in self.sessions:
-            if session.from_user_uuid:
-                sessions_by_user[session.from_user_uuid].append(session)
+        # Sessions are loaded sorted by begin_at (session start time), so
+        # grouping the row indices by from_user_uuid keeps them in order
+        grouped = (
+            self.sessions_df.with_row_index("row")
+            .drop_nulls("from_user_uuid")
+            .group_by("from_user_uuid", maintain_order=True)
+            .agg("row")
+        )
+        sessions_by_user: dict[bytes, list[Session]] = {
+            user_uuid: [self.sessions[row] for row in rows]
+            for user_uuid, rows in grouped.iter_rows()
+        }
         
-        # Sort sessions by begin_at and assign to users
+        # Assign to users
         for user in self.users:
-            user_sessions = sessions_by_user.get(user.uuid, [])
-            # Sort by begin_at timestamp (session start time)
-            user_sessions.sort(key=lambda x: x.begin_at or datetime.min)
-            user.sessions = user_sessions
+            user.sessions = sessions_by_user.get(user.uuid, _EMPTY)
+        self._invalidate_stats()
     
-    def get_user_by_uuid(self, uuid: UUID) -> User | None:
+    def nested_users_df(self) -> pl.DataFrame:
+        """Get users with their sessions and messages nested as columns.
+        
+        The whole hierarchy is built by one Polars query over the loaded
+        frames (hash joins and list aggregations in native code), without
+        going through the model objects. It does not require link_all.
+        
+        Returns:
+            users_df with a "sessions" column holding, per user, a list of
+            session structs sorted by begin_at. Each session struct has the
+            Session fields plus a "messages" field holding a list of
+            SessionText structs sorted by start_at.
+        """
+        # The frames are loaded sorted, so order-preserving group_by keeps
+        # sessions and messages in order
+        messages = (
+            self.session_texts_df.lazy()
+            .select("session_uuid", pl.struct(pl.all()).alias("messages"))
+            .group_by("session_uuid", maintain_order=True)
+            .agg("messages")
+        )
+        sessions = (
+            self.sessions_df.lazy()
+            .join(messages, left_on="uuid", right_on="session_uuid", how="left", maintain_order="left")
+            .with_columns(pl.col("messages").fill_null([]))
+            .select("from_user_uuid", pl.struct(pl.all()).alias("sessions"))
+            .group_by("from_user_uuid", maintain_order=True)
+            .agg("sessions")
+        )
+        return (
+            self.users_df.lazy()
+            .join(sessions, left_on="uuid", right_on="from_user_uuid", how="left", maintain_order="left")
+            .with_columns(pl.col("sessions").fill_null([]))
+            .collect()
+        )
+    
+    def get_user_by_uuid(self, uuid: bytes | UUID) -> User | None:
         """Get a user by their UUID.
         
         Args:
-            uuid: The user's UUID
+            uuid: The user's UUID, as raw bytes or a UUID object
             
         Returns:
             User object or None if not found
         """
+        if isinstance(uuid, UUID):
+            uuid = uuid.bytes
         return self._users_by_uuid.get(uuid)
     
-    def get_session_by_uuid(self, uuid: UUID) -> Session | None:
+    def get_session_by_uuid(self, uuid: bytes | UUID) -> Session | None:
         """Get a session by its UUID.
         
         Args:
-            uuid: The session's UUID
+            uuid: The session's UUID, as raw bytes or a UUID object
             
         Returns:
             Session object or None if not found
         """
+        if isinstance(uuid, UUID):
+            uuid = uuid.bytes
         return self._sessions_by_uuid.get(uuid)
     
-    @property
+    @cached_property
     def stats(self) -> dict:
         """Get statistics about the loaded data.
         
+        Computed on first access and cached until data is loaded or linked
+        again.
+        
         Returns:
             Dictionary with counts of users, sessions, and session texts
         """
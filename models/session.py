@@ -1,22 +1,65 @@
 """Session model representing a phone call session."""
 
-import csv
+from collections.abc import Sequence
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+import polars as pl
 
-from .session_text import SessionText
+from ._parsing import column_expr, datetime_expr, frame_to_models, uuid_expr
+from .session_text import MessageView
 
+if TYPE_CHECKING:
+    from .session_text import SessionText
 
-class Session(BaseModel):
+# Accepted spellings of boolean CSV values (both strings and numeric 0/1)
+_BOOL_MAP = {
+    "true": True, "True": True, "TRUE": True,
+    "yes": True, "Yes": True, "YES": True,
+    "1": True,
+    "false": False, "False": False, "FALSE": False,
+    "no": False, "No": False, "NO": False,
+    "0": False,
+}
+
+# Column types of the DataFrames collected from Session.scan_csv, in field order
+SESSION_SCHEMA = pl.Schema({
+    "uuid": pl.Binary,
+    "from_user_uuid": pl.Binary,
+    "session_type": pl.Int64,
+    "begin_at": pl.Datetime("us"),
+    "end_at": pl.Datetime("us"),
+    "duration": pl.Float64,
+    "from_language": pl.String,
+    "to_language": pl.String,
+    "is_paid": pl.Boolean,
+    "is_translation_enabled": pl.Boolean,
+    "is_ai_call": pl.Boolean,
+})
+
+
+class _MessageLink:
+    """Slots through which DataLoader links a Session to its messages.
+    
+    Messages stay in the loader's shared session text frame; a session only
+    records where its rows are. Declaring the slots on a base class keeps
+    them out of the dataclass fields, so fields(), asdict() and astuple()
+    only see the session's own data.
+    """
+    
+    __slots__ = ("_texts_df", "_texts_range")
+
+
+@dataclass(slots=True)
+class Session(_MessageLink):
     """A phone call session.
     
     Attributes:
-        uuid: UUID of the session
-        from_user_uuid: UUID of the user who initiated the call
+        uuid: UUID of the session, as 16 raw bytes
+        from_user_uuid: UUID of the user who initiated the call, as 16 raw bytes
         session_type: Type of session
         begin_at: When the call began
         end_at: When the call ended
@@ -26,11 +69,12 @@ class Session(BaseModel):
         is_paid: Whether the call was paid
         is_translation_enabled: Whether translation was enabled
         is_ai_call: Whether this is an AI call
-        messages: List of conversation messages (populated by DataLoader)
+        messages: Conversation messages sorted by start_at (empty until
+            DataLoader links session texts)
     """
     
-    uuid: UUID
-    from_user_uuid: Optional[UUID] = None
+    uuid: bytes
+    from_user_uuid: Optional[bytes] = None
     session_type: int = 0
     begin_at: Optional[datetime] = None
     end_at: Optional[datetime] = None
@@ -41,89 +85,94 @@ class Session(BaseModel):
     is_translation_enabled: bool = False
     is_ai_call: bool = False
     
-    # Relationship field - populated by DataLoader
-    messages: list[SessionText] = Field(default_factory=list)
-    
-    model_config = {
-        "populate_by_name": True,
-    }
-    
     @classmethod
-    def load_from_csv(cls, file_path: str | Path) -> list["Session"]:
-        """Load Session records from a CSV file.
+    def scan_csv(cls, file_path: str | Path) -> pl.LazyFrame:
+        """Lazily scan Session records from a CSV file.
+        
+        Nothing is read until the result is collected, so filters applied to
+        the returned LazyFrame are evaluated while the CSV is decoded and
+        discarded rows are never materialized. Malformed rows are dropped.
+        UUID columns hold the 16 raw bytes of each UUID.
         
         Args:
             file_path: Path to the session.csv file
             
         Returns:
-            List of Session instances (without messages populated)
+            LazyFrame with one column per Session field (except messages)
         """
-        records = []
         file_path = Path(file_path)
+        lf = pl.scan_csv(file_path, infer_schema=False, null_values=[""])
+        columns = lf.collect_schema().names()
         
-        def parse_datetime(value: str) -> Optional[datetime]:
-            if not value:
-                return None
-            try:
-                return datetime.fromisoformat(value)
-            except ValueError:
-                return None
+        def parse_int(name: str, default: int = 0) -> pl.Expr:
+            return column_expr(name, columns).cast(pl.Int64, strict=False).fill_null(default)
         
-        def parse_uuid(value: str) -> Optional[UUID]:
-            if not value:
-                return None
-            try:
-                return UUID(value)
-            except ValueError:
-                return None
+        def parse_float(name: str, default: float = 0.0) -> pl.Expr:
+            return column_expr(name, columns).cast(pl.Float64, strict=False).fill_null(default)
         
-        def parse_int(value: str, default: int = 0) -> int:
-            if not value:
-                return default
-            try:
-                return int(value)
-            except ValueError:
-                return default
+        def parse_bool(name: str, default: bool = False) -> pl.Expr:
+            # One hash lookup per value; no lowercased copy of the column
+            return column_expr(name, columns).replace_strict(_BOOL_MAP, default=default, return_dtype=pl.Boolean)
         
-        def parse_float(value: str, default: float = 0.0) -> float:
-            if not value:
-                return default
-            try:
-                return float(value)
-            except ValueError:
-                return default
+        return lf.select(
+            uuid_expr("uuid", columns),
+            uuid_expr("from_user_uuid", columns),
+            parse_int("session_type"),
+            datetime_expr("begin_at", columns),
+            datetime_expr("end_at", columns),
+            parse_float("duration"),
+            column_expr("from_language", columns).fill_null(""),
+            column_expr("to_language", columns).fill_null(""),
+            parse_bool("is_paid"),
+            parse_bool("is_translation_enabled"),
+            parse_bool("is_ai_call"),
+        ).drop_nulls("uuid")
+    
+    @classmethod
+    def from_frame(cls, df: pl.DataFrame) -> list["Session"]:
+        """Build Session instances from a collected scan_csv DataFrame.
+        
+        Args:
+            df: DataFrame of session rows
+            
+        Returns:
+            List of Session instances (without messages populated), in row order
+        """
+        return frame_to_models(cls, df)
+    
+    @classmethod
+    def load_from_csv(cls, file_path: str | Path) -> list["Session"]:
+        """Load Session records from a CSV file.
         
-        def parse_bool(value: str, default: bool = False) -> bool:
-            if not value:
-                return default
-            # Handle both string representations and numeric 0/1
-            if value.lower() in ('true', '1', 'yes'):
-                return True
-            elif value.lower() in ('false', '0', 'no'):
-                return False
-            return default
+        Args:
+            file_path: Path to the session.csv file
+            
+        Returns:
+            List of Session instances (without messages populated)
+        """
+        return cls.from_frame(cls.scan_csv(file_path).collect())
+    
+    @property
+    def messages(self) -> Sequence["SessionText"]:
+        """Get the session's messages, sorted by start_at.
         
-        with open(file_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                try:
-                    record = cls(
-                        uuid=UUID(row["uuid"]),
-                        from_user_uuid=parse_uuid(row.get("from_user_uuid", "")),
-                        session_type=parse_int(row.get("session_type", "")),
-                        begin_at=parse_datetime(row.get("begin_at", "")),
-                        end_at=parse_datetime(row.get("end_at", "")),
-                        duration=parse_float(row.get("duration", "")),
-                        from_language=row.get("from_language", ""),
-                        to_language=row.get("to_language", ""),
-                        is_paid=parse_bool(row.get("is_paid", "")),
-                        is_translation_enabled=parse_bool(row.get("is_translation_enabled", "")),
-                        is_ai_call=parse_bool(row.get("is_ai_call", "")),
-                    )
-                    records.append(record)
-                except (ValueError, KeyError):
-                    # Skip malformed rows
-                    continue
-                    
-        return records
-
+        The view is sliced from the shared session text frame on access (an
+        O(1) operation), so messages cost nothing until they are used.
+        """
+        try:
+            texts_df = self._texts_df
+        except AttributeError:
+            # Not linked yet
+            return ()
+        offset, length = self._texts_range
+        return MessageView(texts_df.slice(offset, length))
+    
+    def _link_messages(self, texts_df: pl.DataFrame, texts_range: tuple[int, int]) -> None:
+        """Point messages at rows [offset, offset + length) of texts_df."""
+        self._texts_df = texts_df
+        self._texts_range = texts_range
+    
+    @property
+    def uuid_str(self) -> str:
+        """Get the canonical string form of this session's UUID."""
+        return str(UUID(bytes=self.uuid))
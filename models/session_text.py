@@ -1,21 +1,38 @@
 """SessionText model representing individual messages in a conversation."""
 
-import csv
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+import polars as pl
 
+from ._parsing import column_expr, datetime_expr, frame_to_models, uuid_expr
 
-class SessionText(BaseModel):
+# Column types of the DataFrames collected from SessionText.scan_csv, in field order
+SESSION_TEXT_SCHEMA = pl.Schema({
+    "id": pl.Int64,
+    "uuid": pl.Binary,
+    "session_uuid": pl.Binary,
+    "start_at": pl.Datetime("us"),
+    "text": pl.String,
+    "text_translated": pl.String,
+    "speaker": pl.Int64,
+    "is_input": pl.Int64,
+    "type": pl.Int64,
+})
+
+
+@dataclass(slots=True)
+class SessionText:
     """A single message/text entry within a session conversation.
     
     Attributes:
         id: Unique identifier for the text entry
-        uuid: UUID of the text entry
-        session_uuid: UUID of the parent session
+        uuid: UUID of the text entry, as 16 raw bytes
+        session_uuid: UUID of the parent session, as 16 raw bytes
         start_at: Timestamp when the message was sent
         text: Original text content
         text_translated: Translated text content (if applicable)
@@ -25,18 +42,61 @@ class SessionText(BaseModel):
     """
     
     id: int
-    uuid: UUID
-    session_uuid: UUID
+    uuid: bytes
+    session_uuid: bytes
     start_at: Optional[datetime] = None
     text: str = ""
     text_translated: str = ""
     speaker: int = 0
     is_input: int = 0
-    type: int = Field(default=0, alias="type")
+    type: int = 0
     
-    model_config = {
-        "populate_by_name": True,
-    }
+    @classmethod
+    def scan_csv(cls, file_path: str | Path) -> pl.LazyFrame:
+        """Lazily scan SessionText records from a CSV file.
+        
+        Nothing is read until the result is collected. Malformed rows are
+        dropped. UUID columns hold the 16 raw bytes of each UUID.
+        
+        Args:
+            file_path: Path to the session_text.csv file
+            
+        Returns:
+            LazyFrame with one column per SessionText field
+        """
+        file_path = Path(file_path)
+        lf = pl.scan_csv(file_path, infer_schema=False, null_values=[""])
+        columns = lf.collect_schema().names()
+        
+        def parse_int(name: str, default: Optional[int] = None) -> pl.Expr:
+            # Unparseable values become null and mark the row as malformed
+            if name not in columns:
+                return pl.lit(default, dtype=pl.Int64).alias(name)
+            return pl.col(name).cast(pl.Int64, strict=False)
+        
+        return lf.select(
+            parse_int("id"),
+            uuid_expr("uuid", columns),
+            uuid_expr("session_uuid", columns),
+            datetime_expr("start_at", columns),
+            column_expr("text", columns).fill_null(""),
+            column_expr("text_translated", columns).fill_null(""),
+            parse_int("speaker", 0),
+            parse_int("is_input", 0),
+            parse_int("type", 0),
+        ).drop_nulls(["id", "uuid", "session_uuid", "speaker", "is_input", "type"])
+    
+    @classmethod
+    def from_frame(cls, df: pl.DataFrame) -> list["SessionText"]:
+        """Build SessionText instances from a collected scan_csv DataFrame.
+        
+        Args:
+            df: DataFrame of session text rows
+            
+        Returns:
+            List of SessionText instances, in row order
+        """
+        return frame_to_models(cls, df)
     
     @classmethod
     def load_from_csv(cls, file_path: str | Path) -> list["SessionText"]:
@@ -48,36 +108,44 @@ class SessionText(BaseModel):
         Returns:
             List of SessionText instances
         """
-        records = []
-        file_path = Path(file_path)
-        
-        with open(file_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                try:
-                    # Parse datetime
-                    start_at = None
-                    if row.get("start_at"):
-                        try:
-                            start_at = datetime.fromisoformat(row["start_at"])
-                        except ValueError:
-                            pass
-                    
-                    record = cls(
-                        id=int(row["id"]),
-                        uuid=UUID(row["uuid"]),
-                        session_uuid=UUID(row["session_uuid"]),
-                        start_at=start_at,
-                        text=row.get("text", ""),
-                        text_translated=row.get("text_translated", ""),
-                        speaker=int(row.get("speaker", 0)),
-                        is_input=int(row.get("is_input", 0)),
-                        type=int(row.get("type", 0)),
-                    )
-                    records.append(record)
-                except (ValueError, KeyError) as e:
-                    # Skip malformed rows
-                    continue
-                    
-        return records
+        return cls.from_frame(cls.scan_csv(file_path).collect())
+    
+    @property
+    def uuid_str(self) -> str:
+        """Get the canonical string form of this message's UUID."""
+        return str(UUID(bytes=self.uuid))
+
 
+class MessageView(Sequence[SessionText]):
+    """Read-only sequence of SessionText records backed by a DataFrame.
+    
+    Rows are kept in columnar form and only materialized as SessionText
+    objects when indexed or iterated, so a view can stand in for a list of
+    messages without allocating one object per row.
+    
+    Attributes:
+        df: The underlying DataFrame, with the columns of SessionText.scan_csv
+    """
+    
+    __slots__ = ("df",)
+    
+    def __init__(self, df: pl.DataFrame):
+        self.df = df
+    
+    def __len__(self) -> int:
+        return self.df.height
+    
+    def __getitem__(self, index: int | slice) -> "SessionText | MessageView":
+        if isinstance(index, slice):
+            return MessageView(self.df[index])
+        if index < 0:
+            index += self.df.height
+        if not 0 <= index < self.df.height:
+            raise IndexError("MessageView index out of range")
+        return SessionText(*self.df.row(index))
+    
+    def __iter__(self) -> Iterator[SessionText]:
+        return iter(SessionText.from_frame(self.df))
+    
+    def __repr__(self) -> str:
+        return f"MessageView(<{self.df.height} messages>)"
@@ -1,90 +1,110 @@
 """User model representing a user in the system."""
 
-import csv
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+import polars as pl
 
-from .session import Session
+from ._parsing import column_expr, datetime_expr, frame_to_models, uuid_expr
 
+if TYPE_CHECKING:
+    from .session import Session
 
-class User(BaseModel):
+# Column types of the DataFrames collected from User.scan_csv, in field order
+USER_SCHEMA = pl.Schema({
+    "uuid": pl.Binary,
+    "nick_name": pl.String,
+    "credits": pl.Float64,
+    "email": pl.String,
+    "registration_time": pl.Datetime("us"),
+})
+
+
+@dataclass(slots=True)
+class User:
     """A user in the system.
     
     Attributes:
-        uuid: UUID of the user
+        uuid: UUID of the user, as 16 raw bytes
         nick_name: User's nickname/display name
         credits: User's credit balance
         email: User's email address
         registration_time: Registration timestamp
-        sessions: List of user's sessions (populated by DataLoader)
+        sessions: User's sessions sorted by begin_at (empty until DataLoader
+            links sessions)
     """
     
-    uuid: UUID
+    uuid: bytes
     nick_name: str = ""
     credits: float = 0.0
     email: str = ""
     registration_time: Optional[datetime] = None
     
-    # Relationship field - populated by DataLoader
-    sessions: list[Session] = Field(default_factory=list)
-    
-    model_config = {
-        "populate_by_name": True,
-    }
+    # Relationship field - set by DataLoader. The default is a shared empty
+    # tuple, so loading does not allocate a container per user.
+    sessions: Sequence["Session"] = field(default=(), init=False, repr=False, compare=False)
     
     @classmethod
-    def load_from_csv(cls, file_path: str | Path) -> list["User"]:
-        """Load User records from a CSV file.
+    def scan_csv(cls, file_path: str | Path) -> pl.LazyFrame:
+        """Lazily scan User records from a CSV file.
+        
+        Nothing is read until the result is collected, so filters applied to
+        the returned LazyFrame are evaluated while the CSV is decoded and
+        discarded rows are never materialized. Malformed rows are dropped.
+        UUID columns hold the 16 raw bytes of each UUID.
         
         Args:
             file_path: Path to the user.csv file
             
         Returns:
-            List of User instances (without sessions populated)
+            LazyFrame with one column per User field (except sessions)
         """
-        records = []
         file_path = Path(file_path)
+        lf = pl.scan_csv(file_path, infer_schema=False, null_values=[""])
+        columns = lf.collect_schema().names()
         
-        def parse_datetime(value: str) -> Optional[datetime]:
-            if not value:
-                return None
-            try:
-                return datetime.fromisoformat(value)
-            except ValueError:
-                return None
+        return lf.select(
+            uuid_expr("uuid", columns),
+            column_expr("nick_name", columns).fill_null(""),
+            column_expr("credits", columns).cast(pl.Float64, strict=False).fill_null(0.0),
+            column_expr("email", columns).fill_null(""),
+            datetime_expr("created_at", columns).alias("registration_time"),
+        ).drop_nulls("uuid")
+    
+    @classmethod
+    def from_frame(cls, df: pl.DataFrame) -> list["User"]:
+        """Build User instances from a collected scan_csv DataFrame.
         
-        def parse_float(value: str, default: float = 0.0) -> float:
-            if not value:
-                return default
-            try:
-                return float(value)
-            except ValueError:
-                return default
+        Args:
+            df: DataFrame of user rows
+            
+        Returns:
+            List of User instances (without sessions populated), in row order
+        """
+        return frame_to_models(cls, df)
+    
+    @classmethod
+    def load_from_csv(cls, file_path: str | Path) -> list["User"]:
+        """Load User records from a CSV file.
         
-        with open(file_path, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                try:
-                    record = cls(
-                        uuid=UUID(row["uuid"]),
-                        nick_name=row.get("nick_name", ""),
-                        credits=parse_float(row.get("credits", "")),
-                        email=row.get("email", ""),
-                        registration_time=parse_datetime(row.get("created_at", "")),
-                    )
-                    records.append(record)
-                except (ValueError, KeyError):
-                    # Skip malformed rows
-                    continue
-                    
-        return records
+        Args:
+            file_path: Path to the user.csv file
+            
+        Returns:
+            List of User instances (without sessions populated)
+        """
+        return cls.from_frame(cls.scan_csv(file_path).collect())
     
     @property
-    def session_ids(self) -> list[UUID]:
-        """Get list of session UUIDs for this user."""
+    def session_ids(self) -> list[bytes]:
+        """Get list of session UUIDs (as raw bytes) for this user."""
         return [session.uuid for session in self.sessions]
-
+    
+    @property
+    def uuid_str(self) -> str:
+        """Get the canonical string form of this user's UUID."""
+        return str(UUID(bytes=self.uuid))
@@ -1,9 +1,22 @@
 """Simple test to load all three models."""
 
-import json
 from pathlib import Path
+
+import orjson
+import polars as pl
+
 from models import DataLoader
 
+
+def uuid_str(expr: pl.Expr) -> pl.Expr:
+    """Format a 16-byte binary UUID expression as canonical UUID strings."""
+    hex_digits = expr.bin.encode("hex")
+    return pl.concat_str(
+        [hex_digits.str.slice(start, length) for start, length in ((0, 8), (8, 4), (12, 4), (16, 4), (20, 12))],
+        separator="-",
+    )
+
+
 # Load all data
 loader = DataLoader("raw_data/")
 loader.load_all()
@@ -20,7 +33,7 @@ print(f"Sessions with messages: {loader.stats['sessions_with_messages']}")
 print("\n=== Sample User ===")
 for user in loader.users[:3]:
     if user.sessions:
-        print(f"User: {user.nick_name} (uuid={user.uuid})")
+        print(f"User: {user.nick_name} (uuid={user.uuid_str})")
         print(f"  Email: {user.email}")
         print(f"  Credits: {user.credits}")
         print(f"  Registration Time: {user.registration_time}")
@@ -33,58 +46,51 @@ for user in loader.users[:3]:
 print("\n=== Exporting Models to JSON ===")
 output_file = Path("models") / "models_export.json"
 
-# Export first 5 users with their sessions and messages
+# Export first 5 users with their first 3 sessions and each session's
+# first 5 messages. The loader builds the nested hierarchy (sessions sorted
+# by begin_at, messages by start_at); only the fields to export are picked
+# here.
+message = pl.element().struct
+message_export = pl.struct(
+    uuid_str(message.field("uuid")).alias("uuid"),
+    uuid_str(message.field("session_uuid")).alias("session_uuid"),
+    message.field("start_at", "text", "text_translated", "speaker", "is_input", "type"),
+)
+
+session = pl.element().struct
+session_export = pl.struct(
+    uuid_str(session.field("uuid")).alias("uuid"),
+    uuid_str(session.field("from_user_uuid")).alias("from_user_uuid"),
+    session.field(
+        "session_type",
+        "begin_at",
+        "end_at",
+        "duration",
+        "from_language",
+        "to_language",
+        "is_paid",
+        "is_translation_enabled",
+        "is_ai_call",
+    ),
+    session.field("messages").list.head(5).list.eval(message_export).alias("messages"),
+)
+
+sample_users = loader.nested_users_df().head(5).select(
+    uuid_str(pl.col("uuid")).alias("uuid"),
+    "nick_name",
+    "email",
+    "credits",
+    "registration_time",
+    pl.col("sessions").list.head(3).list.eval(session_export),
+)
+
 export_data = {
     "stats": loader.stats,
-    "sample_users": []
+    "sample_users": sample_users.to_dicts(),
 }
 
-for user in loader.users[:5]:
-    user_data = {
-        "uuid": str(user.uuid),
-        "nick_name": user.nick_name,
-        "email": user.email,
-        "credits": user.credits,
-        "registration_time": user.registration_time.isoformat() if user.registration_time else None,
-        "sessions": []
-    }
-    
-    for session in user.sessions[:3]:  # First 3 sessions per user
-        session_data = {
-            "uuid": str(session.uuid),
-            "from_user_uuid": str(session.from_user_uuid) if session.from_user_uuid else None,
-            "session_type": session.session_type,
-            "begin_at": session.begin_at.isoformat() if session.begin_at else None,
-            "end_at": session.end_at.isoformat() if session.end_at else None,
-            "duration": session.duration,
-            "from_language": session.from_language,
-            "to_language": session.to_language,
-            "is_paid": session.is_paid,
-            "is_translation_enabled": session.is_translation_enabled,
-            "is_ai_call": session.is_ai_call,
-            "messages": []
-        }
-        
-        for message in session.messages[:5]:  # First 5 messages per session
-            message_data = {
-                "uuid": str(message.uuid),
-                "session_uuid": str(message.session_uuid),
-                "start_at": message.start_at.isoformat() if message.start_at else None,
-                "text": message.text,
-                "text_translated": message.text_translated,
-                "speaker": message.speaker,
-                "is_input": message.is_input,
-                "type": message.type
-            }
-            session_data["messages"].append(message_data)
-        
-        user_data["sessions"].append(session_data)
-    
-    export_data["sample_users"].append(user_data)
-
-# Write to JSON file
-with open(output_file, "w", encoding="utf-8") as f:
-    json.dump(export_data, f, indent=2, ensure_ascii=False)
+# Write to JSON file; orjson serializes datetimes natively in ISO 8601
+output_file.write_bytes(orjson.dumps(export_data, option=orjson.OPT_INDENT_2))
 
 print(f"Models exported to: {output_file}")
 print(f"Exported {len(export_data['sample_users'])} users with their sessions and messages")